@@ -0,0 +1,83 @@
+"""Serialization tools for moving large data buffers between processes
+through shared memory instead of the pipe underlying a ``Queue``.
+"""
+
+import os
+import pickle
+from typing import Any, List, Tuple
+
+try:  # Shared memory and pickle protocol 5 require Python 3.8 or newer
+    from multiprocessing import resource_tracker, shared_memory
+
+except ImportError:  # pragma: no cover
+    resource_tracker = shared_memory = None
+
+# Windows releases shared memory once the creating process closes its handle,
+# which is before the receiving process has a chance to read it
+SHARED_MEMORY_SUPPORTED = shared_memory is not None and os.name != 'nt'
+
+# The minimum size (in bytes) of a buffer to be moved through shared memory
+SHARED_MEMORY_THRESHOLD = 64 * 1024
+
+
+class SharedMemoryPayload:
+    """Pickled data with large buffers stored out-of-band in shared memory"""
+
+    __slots__ = ('data', 'blocks')
+
+    def __init__(self, obj: Any) -> None:
+        """Serialize an object, copying any large buffers into shared memory
+
+        Ownership of the shared memory passes to the payload. Memory is
+        released once the payload is loaded by the receiving process.
+
+        Args:
+            obj: The object to serialize
+        """
+
+        self.blocks: List[Tuple[str, int]] = []  # The name and size of each shared memory block
+        self.data = pickle.dumps(obj, protocol=5, buffer_callback=self._store_buffer)
+
+    def _store_buffer(self, buffer: pickle.PickleBuffer) -> bool:
+        """Copy a buffer into shared memory if it exceeds the size threshold
+
+        Args:
+            buffer: The buffer exposed by the pickler
+
+        Returns:
+            Whether the buffer should be serialized in-band instead
+        """
+
+        try:
+            view = buffer.raw()
+
+        except BufferError:  # Non-contiguous buffers are always serialized in-band
+            return True
+
+        if view.nbytes < SHARED_MEMORY_THRESHOLD:
+            return True
+
+        block = shared_memory.SharedMemory(create=True, size=view.nbytes)
+        block.buf[:view.nbytes] = view
+
+        # The receiving process is responsible for releasing the memory
+        resource_tracker.unregister(block._name, 'shared_memory')
+        self.blocks.append((block.name, view.nbytes))
+        block.close()
+        return False
+
+    def load(self) -> Any:
+        """Deserialize the payload and release any shared memory
+
+        Returns:
+            The deserialized object
+        """
+
+        buffers = []
+        for name, size in self.blocks:
+            block = shared_memory.SharedMemory(name=name)
+            buffers.append(bytearray(block.buf[:size]))
+            block.close()
+            block.unlink()
+
+        return pickle.loads(self.data, buffers=buffers)
@@ -8,15 +8,32 @@ type of connector. ``Output`` connectors are used to send data and
 from __future__ import annotations
 
 import multiprocessing as mp
+import multiprocessing.connection
+from collections import deque
 from queue import Empty
-from typing import Any, List, Optional, TYPE_CHECKING
+from typing import Any, Iterable, List, Optional, TYPE_CHECKING
 
+from ._serialization import SHARED_MEMORY_SUPPORTED, SharedMemoryPayload
 from ._utils import KillSignal, ObjectCollection
 from .exceptions import MissingConnectionError, OverwriteConnectionError
 
 if TYPE_CHECKING:  # pragma: no cover
     from .nodes import AbstractNode
 
+# Connector queues communicate over pipes whose buffer size (in bytes) is set
+# by ``multiprocessing.connection.BUFSIZE``. The standard library default is
+# small enough to force multiple read/write calls for moderately sized
+# messages on some platforms (e.g., Windows), so we raise it here. Set
+# ``multiprocessing.connection.BUFSIZE`` directly to tune the value further.
+PIPE_BUFFER_SIZE = 64 * 1024
+mp.connection.BUFSIZE = max(mp.connection.BUFSIZE, PIPE_BUFFER_SIZE)
+
+
+class _Batch(list):
+    """A collection of values communicated between connectors as a single queue item"""
+
+    __slots__ = ()
+
 
 class AbstractConnector:
     """Exposes select functionality from an underlying ``Queue`` object"""
@@ -59,22 +76,32 @@ class AbstractConnector:
 class Input(AbstractConnector):
     """Handles the input of data into a pipeline node"""
 
-    def __init__(self, name: str = None, maxsize: int = 0) -> None:
+    def __init__(self, name: str = None, maxsize: int = 0, shared_memory: bool = False) -> None:
         """Handles the input of data into a pipeline node
 
+        Enabling ``shared_memory`` moves large out-of-band data buffers (e.g.,
+        ``numpy`` arrays or ``pickle.PickleBuffer`` objects) into shared memory instead of writing them through
+        the pipe underlying the connector queue. This avoids redundant copies
+        when communicating array-like data, but adds a small serialization
+        overhead for other data types. The option is ignored on platforms
+        without support for shared memory.
+
         Args:
             name: Optional human readable name for the connector object
             maxsize: The maximum number of communicated items to store in memory
+            shared_memory: Communicate large data buffers through shared memory
         """
 
         super().__init__(name)
         self._maxsize = maxsize
+        self._shared_memory = shared_memory and SHARED_MEMORY_SUPPORTED
         self._queue = mp.Queue(maxsize=maxsize)
+        self._buffer = deque()  # Values received as part of a batch but not yet retrieved
 
     def empty(self) -> bool:
         """Return if the connection queue is empty"""
 
-        return self._queue.empty()
+        return not self._buffer and self._queue.empty()
 
     def full(self) -> bool:
         """Return if the connection queue is full"""
@@ -107,6 +134,31 @@ class Input(AbstractConnector):
 
         self._queue = mp.Queue(maxsize=maxsize)
 
+    def _read(self, timeout: Optional[float] = None) -> Any:
+        """Return the next available value from the connector
+
+        Batches of data are unpacked into a local buffer and returned one
+        value at a time.
+
+        Args:
+            timeout: Seconds to wait for data on the underlying queue (Default: Do not block)
+
+        Raises:
+            Empty: If no data is available
+        """
+
+        if not self._buffer:
+            data = self._queue.get(timeout=timeout) if timeout else self._queue.get_nowait()
+            if type(data) is SharedMemoryPayload:
+                data = data.load()
+
+            if type(data) is not _Batch:
+                return data
+
+            self._buffer.extend(data)
+
+        return self._buffer.popleft()
+
     def get(self, timeout: Optional[int] = None, refresh_interval: int = 2):
         """Blocking call to retrieve input data
 
@@ -129,13 +181,53 @@ class Input(AbstractConnector):
                 return KillSignal
 
             try:
-                return self._queue.get(timeout=min(timeout, refresh_interval))
+                return self._read(timeout=min(timeout, refresh_interval))
 
             except (Empty, TimeoutError):
                 timeout -= refresh_interval
 
         raise TimeoutError
 
+    def get_many(self, max_items: int = 100, timeout: Optional[int] = None, refresh_interval: int = 2):
+        """Blocking call to retrieve multiple input values at once
+
+        Blocks until at least one value is available and then returns any
+        additional data already waiting in the connector, up to ``max_items``.
+        Releases automatically when no more data is coming from upstream.
+
+        Args:
+            max_items: The maximum number of values to return
+            timeout: Raise a TimeoutError if data is not retrieved within the given number of seconds
+            refresh_interval: How often to check if data is expected from upstream
+
+        Returns:
+            A list of retrieved values or a ``KillSignal``
+
+        Raises:
+            TimeOutError: Raised if the get call times out
+        """
+
+        data = self.get(timeout=timeout, refresh_interval=refresh_interval)
+        if data is KillSignal:
+            return KillSignal
+
+        batch = [data]
+        while len(batch) < max_items:
+            try:
+                data = self._read()
+
+            except Empty:
+                break
+
+            # Leave kill signals for the next call to ``get``
+            if data is KillSignal:
+                self._buffer.appendleft(data)
+                break
+
+            batch.append(data)
+
+        return batch
+
     def iter_get(self) -> Any:
         """Iterator that returns input data
 
@@ -153,15 +245,25 @@ class Input(AbstractConnector):
 class Output(AbstractConnector):
     """Handles the output of data from a pipeline node"""
 
-    def __init__(self, name: str = None) -> None:
+    def __init__(self, name: str = None, batch_size: int = 1) -> None:
         """Handles the output of data from a pipeline node
 
+        Data is buffered in memory and communicated to connected inputs once
+        ``batch_size`` values have accumulated. Each batch counts as a single
+        item against the ``maxsize`` of the receiving input.
+
         Args:
             name: Optional human readable name for the connector object
+            batch_size: The number of values to buffer before sending data to connected inputs
         """
 
+        if batch_size < 1:
+            raise ValueError(f'Connector batch size must be at least one (got {batch_size}).')
+
         super().__init__(name)
         self._partner: Optional[Input] = None  # The connector object of another node
+        self._buffer = []  # Data waiting to be sent to connected inputs
+        self.batch_size = batch_size
 
     def connect(self, connector: Input) -> None:
         """Establish the flow of data between this connector and another connector
@@ -186,6 +288,7 @@ class Output(AbstractConnector):
         if connector not in self.get_partners():
             raise MissingConnectionError(f'Output connector is not connected to the given connector: {connector}')
 
+        self.flush()
         connector._connected_partners.remove(self)
         self._connected_partners.remove(connector)
 
@@ -203,5 +306,38 @@ class Output(AbstractConnector):
         if not self.is_connected and raise_missing_connection:
             raise MissingConnectionError('Output connector is not connected to any input connectors.')
 
+        self._buffer.append(x)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def put_many(self, values: Iterable, raise_missing_connection: bool = True) -> None:
+        """Add multiple values into the connector
+
+        Values are communicated to connected inputs in batches, amortizing
+        the cost of inter-process communication across all values.
+
+        Args:
+            values: The values to put into the connector
+            raise_missing_connection: Raise an error if trying to put data into an unconnected output
+
+        Raises:
+            MissingConnectionError: If trying to put data into an output that isn't connected to an input
+        """
+
+        if not self.is_connected and raise_missing_connection:
+            raise MissingConnectionError('Output connector is not connected to any input connectors.')
+
+        self._buffer.extend(values)
+        if len(self._buffer) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Send any buffered data to connected input connectors"""
+
+        if not self._buffer:
+            return
+
+        data = self._buffer[0] if len(self._buffer) == 1 else _Batch(self._buffer)
+        self._buffer.clear()
         for partner in self.get_partners():
-            partner._queue.put(x)
+            partner._queue.put(SharedMemoryPayload(data) if partner._shared_memory else data)
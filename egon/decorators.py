@@ -77,8 +77,12 @@ class WrappedNode(nodes.Node):
     def action(self) -> None:
         """Call the wrapped function and put it's return in the ``output`` connector."""
 
-        for data in self.input.iter_get():
-            self.output.put(self._func(data))
+        while True:
+            batch = self.input.get_many()
+            if batch is connectors.KillSignal:
+                return
+
+            self.output.put_many([self._func(data) for data in batch])
 
     def __repr__(self) -> str:  # pragma: no cover
         return f'<WrappedNode(wrapped_function={self._func.__name__}) object at {hex(id(self))}>'
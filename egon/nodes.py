@@ -159,6 +159,10 @@ class AbstractNode(abc.ABC):
         self.setup()
         self.action()
         self.teardown()
+
+        for output_connector in self._get_attrs(connectors.Output):
+            output_connector.flush()
+
         self._set_process_finished()
 
     def expecting_data(self) -> bool:
@@ -1,9 +1,11 @@
 """Tests the connectivity and functionality of ``Input`` connector objects."""
 
 import time
-from unittest import TestCase
+from pickle import PickleBuffer
+from unittest import TestCase, skipUnless
 
-from egon.connectors import Input, KillSignal, Output
+from egon._serialization import SHARED_MEMORY_SUPPORTED, SHARED_MEMORY_THRESHOLD, SharedMemoryPayload
+from egon.connectors import Input, KillSignal, Output, _Batch
 from egon.mock import MockSource, MockTarget
 
 
@@ -128,6 +130,92 @@ class InputIterGet(TestCase):
         self.assertEqual(next(self.target.input.iter_get()), test_val)
 
 
+class InputGetMany(TestCase):
+    """Test batched data retrieval from ``Input`` instances"""
+
+    def setUp(self) -> None:
+        """Define a node with an attached ``Input`` instance"""
+
+        self.target = MockTarget()
+
+    def test_returns_available_values(self) -> None:
+        """Test all values waiting in the queue are returned together"""
+
+        test_vals = [1, 2, 3]
+        self.target.input._queue.put(_Batch(test_vals))
+        self.assertListEqual(test_vals, self.target.input.get_many())
+
+    def test_respects_max_items(self) -> None:
+        """Test no more than ``max_items`` values are returned"""
+
+        self.target.input._queue.put(_Batch([1, 2, 3]))
+        self.assertListEqual([1, 2], self.target.input.get_many(max_items=2))
+        self.assertListEqual([3], self.target.input.get_many(max_items=2))
+
+    def test_batches_are_unpacked_by_get(self) -> None:
+        """Test values communicated as a batch are returned individually by ``get``"""
+
+        self.target.input._queue.put(_Batch([1, 2]))
+        self.assertEqual(1, self.target.input.get(timeout=15))
+        self.assertEqual(2, self.target.input.get(timeout=15))
+
+    def test_kill_signal_is_not_batched(self) -> None:
+        """Test a ``KillSignal`` ends a batch and is returned by the next call"""
+
+        self.target.input._queue.put(1)
+        self.target.input._queue.put(KillSignal)
+        time.sleep(1)  # Let the queue update
+
+        self.assertListEqual([1], self.target.input.get_many())
+        self.assertIs(KillSignal, self.target.input.get_many())
+
+
+@skipUnless(SHARED_MEMORY_SUPPORTED, 'Shared memory is not supported on this platform')
+class SharedMemoryTransfer(TestCase):
+    """Test the communication of data through shared memory"""
+
+    def setUp(self) -> None:
+        """Connect an ``Output`` to an ``Input`` using shared memory"""
+
+        self.output = Output()
+        self.input = Input(shared_memory=True)
+        self.output.connect(self.input)
+
+    def test_large_buffers_are_recovered(self) -> None:
+        """Test buffers above the size threshold are moved through shared memory"""
+
+        test_val = bytearray(range(256)) * 1024
+        self.output.put(PickleBuffer(test_val))
+
+        payload = self.input._queue.get(timeout=15)
+        self.assertEqual(1, len(payload.blocks))
+        self.assertEqual(test_val, payload.load())
+
+    def test_batches_are_recovered(self) -> None:
+        """Test batched data is recovered through shared memory"""
+
+        self.output.put_many(['a', PickleBuffer(bytearray(SHARED_MEMORY_THRESHOLD)), 3])
+        payload = self.input._queue.get(timeout=15)
+        self.assertEqual(1, len(payload.blocks))
+        self.assertListEqual(['a', bytearray(SHARED_MEMORY_THRESHOLD), 3], payload.load())
+
+    def test_payload_is_loaded_by_get(self) -> None:
+        """Test the ``get`` method deserializes data moved through shared memory"""
+
+        connector = Input(shared_memory=True)
+        test_val = bytearray(SHARED_MEMORY_THRESHOLD)
+        connector._queue.put(SharedMemoryPayload(PickleBuffer(test_val)))
+        self.assertEqual(test_val, connector.get(timeout=15))
+
+    def test_small_values_are_in_band(self) -> None:
+        """Test small values are not moved through shared memory"""
+
+        self.output.put(PickleBuffer(bytearray(10)))
+        payload = self.input._queue.get(timeout=15)
+        self.assertFalse(payload.blocks)
+        self.assertEqual(bytearray(10), payload.load())
+
+
 class MaxQueueSize(TestCase):
     """Tests the setting/getting of the maximum size for the underlying queue"""
 
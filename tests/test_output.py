@@ -128,15 +128,67 @@ class ConnectorPut(TestCase):
         self.source.output.put(test_val)
         self.assertEqual(self.target.input._queue.get(), test_val)
 
+    def test_put_many_stores_batch_in_queue(self) -> None:
+        """Test the ``put_many`` method stores values as a single queue item"""
+
+        test_vals = [1, 2, 3]
+        self.source.output.put_many(test_vals)
+        self.assertListEqual(test_vals, self.target.input._queue.get())
+
     def test_error_if_unconnected(self) -> None:
         with self.assertRaises(MissingConnectionError):
             Output().put(5)
 
+        with self.assertRaises(MissingConnectionError):
+            Output().put_many([5])
+
     @staticmethod
     def test_error_override() -> None:
         Output().put(5, raise_missing_connection=False)
 
 
+class BufferedPut(TestCase):
+    """Test the buffering of data by ``Output`` instances"""
+
+    def setUp(self) -> None:
+        """Connect a buffered ``Output`` instance to an ``Input``"""
+
+        self.output = Output(batch_size=3)
+        self.input = Input()
+        self.output.connect(self.input)
+
+    def test_error_on_non_positive_batch_size(self) -> None:
+        """Test a ``ValueError`` is raised for a batch size less than one"""
+
+        with self.assertRaises(ValueError):
+            Output(batch_size=0)
+
+    def test_data_is_buffered(self) -> None:
+        """Test data is not sent until the batch size is reached"""
+
+        self.output.put(1)
+        self.output.put(2)
+        sleep(1)  # Give the queue a chance to update
+        self.assertTrue(self.input._queue.empty())
+
+        self.output.put(3)
+        self.assertListEqual([1, 2, 3], self.input._queue.get(timeout=15))
+
+    def test_flush_sends_partial_batch(self) -> None:
+        """Test the ``flush`` method sends data before the batch size is reached"""
+
+        self.output.put_many([1, 2])
+        self.output.flush()
+        self.assertListEqual([1, 2], self.input._queue.get(timeout=15))
+
+    def test_flush_on_disconnect(self) -> None:
+        """Test buffered data is sent before disconnecting"""
+
+        self.output.put(1)
+        self.output.disconnect(self.input)
+        self.assertEqual(1, self.input._queue.get(timeout=15))
+
+
 class PartnerMapping(TestCase):
     """Test connectors with an established connection correctly map to neighboring connectors/nodes"""
 